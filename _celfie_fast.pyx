@@ -0,0 +1,67 @@
+# cython: language_level=3
+"""
+Celfie Lock - Compiled LSB helpers
+
+Optional C extension for the steganography hot loops in celfie.py. When it
+is not built, celfie.py falls back to its Numba or NumPy implementations.
+
+Build in place with:
+    cythonize -i _celfie_fast.pyx
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef embed_bits(unsigned char[::1] pixels, const unsigned char[::1] payload):
+    """
+    Write the bits of payload (MSB first) into the LSBs of pixels, in place.
+    
+    Args:
+        pixels: Writable uint8 buffer of channel values
+        payload: Bytes to hide, one bit per channel starting at pixels[0]
+    """
+    cdef Py_ssize_t i, b, base
+    cdef unsigned char byte
+    
+    if pixels.shape[0] < payload.shape[0] * 8:
+        raise ValueError("Payload does not fit in pixel buffer")
+    
+    for i in range(payload.shape[0]):
+        byte = payload[i]
+        base = i * 8
+        for b in range(8):
+            pixels[base + b] = (pixels[base + b] & 0xFE) | ((byte >> (7 - b)) & 1)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef bytes extract_bits(const unsigned char[::1] pixels, Py_ssize_t n_bytes):
+    """
+    Rebuild n_bytes bytes (MSB first) from the LSBs of pixels.
+    
+    Args:
+        pixels: uint8 buffer of channel values, starting at the first bit to read
+        n_bytes: Number of bytes to reassemble
+    
+    Returns:
+        bytes: The reassembled data
+    """
+    cdef Py_ssize_t i, b, base
+    cdef unsigned char byte
+    cdef bytearray out = bytearray(n_bytes)
+    cdef unsigned char[::1] view = out
+    
+    if n_bytes < 0 or pixels.shape[0] < n_bytes * 8:
+        raise ValueError("Not enough pixel data to extract")
+    
+    for i in range(n_bytes):
+        byte = 0
+        base = i * 8
+        for b in range(8):
+            byte = (byte << 1) | (pixels[base + b] & 1)
+        view[i] = byte
+    return bytes(out)
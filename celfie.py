@@ -9,60 +9,107 @@ License: MIT
 Support: https://ko-fi.com/celfielock
 
 Usage:
-    from celfie import encode, decode
+    from celfie import encode, decode, encode_many
     
     # Hide a message
     encode("input.jpg", "protected.png", "Secret message", link="https://example.com")
     
     # Reveal the message
     message = decode("protected.png")
+    
+    # Protect many images in parallel
+    encode_many([("a.jpg", "a.png", "Secret"), ("b.jpg", "b.png", "Secret")])
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+import numpy as np
 import os
 import struct
 import zlib
 import base64
-import hashlib
-import secrets
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+try:
+    import pyzstd
+except ImportError:
+    pyzstd = None
+
+# Numba kernels are opt-in: importing numba adds ~0.3 s to every process,
+# which outweighs the kernel speedup unless payloads are large
+njit = None
+if os.environ.get("CELFIE_NUMBA") == "1":
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+try:
+    import _celfie_fast
+except ImportError:
+    _celfie_fast = None
 
 # Constants for steganography implementation
 SIGNATURE = "CELFIE"
-VERSION = 1
-HEADER_SIZE = 74  # 6+4+32+16+8+8 = 74 bytes for signature+version+key+salt+length+delimiter
+FERNET_VERSION = 1  # Fernet + zlib (decode only)
+ZLIB_VERSION = 2  # AES-256-GCM + zlib (default, readable without extra packages)
+ZSTD_VERSION = 3  # AES-256-GCM + zstd (written only for compression="zstd")
+VERSION = ZSTD_VERSION  # Newest header version this module understands
+# signature, version, key, nonce, 4 reserved bytes, data length, delimiter
+HEADER_STRUCT = struct.Struct("<6sI32s12s4xQ8s")
+HEADER_SIZE = HEADER_STRUCT.size  # 6+4+32+12+4+8+8 = 74 bytes
 DELIMITER = b'\x00\xFF\x00\xFF\x00\xFF\x00\xFF'  # Distinct delimiter pattern
+CHANNELS = 3  # Pixels are always handled as RGB, one hidden bit per channel
+ZSTD_MT_MIN_SIZE = 1 << 20  # Payloads up to ~one zstd job (1 MB) compress single-threaded
+GCM_TAG_SIZE = 16  # AES-GCM authentication tag appended to every ciphertext
+LSB_CLEAR_MASK_64 = np.uint64(0xFEFEFEFEFEFEFEFE)  # Clears the LSB of all 8 byte lanes
+
+# zstd worker threads per encode. A single worker only adds async overhead,
+# so one-CPU machines stay single-threaded; batch workers also set this to 0
+# because the pool already runs one process per CPU
+_zstd_threads = os.cpu_count() or 0
+if _zstd_threads < 2:
+    _zstd_threads = 0
 
 
-def derive_key_from_image(image_data, salt=None):
+@functools.lru_cache(maxsize=1)
+def _load_default_font():
     """
-    Derive encryption key from image content and optional salt.
-    Creates a unique key based on the image itself.
+    Load Pillow's built-in default font once.
+    
+    Returns:
+        A PIL font object, or None if it could not be loaded
+    """
+    try:
+        return ImageFont.load_default()
+    except:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_name, font_size):
+    """
+    Load a TrueType font, falling back to Pillow's default font.
+    
+    Results are cached by (font_name, font_size) so repeated watermarks do
+    not re-open and re-parse the font file. Loaded fonts are never modified,
+    so sharing them between calls (and threads) is safe.
     
     Args:
-        image_data: Raw bytes of image pixel data
-        salt: Optional salt bytes (16 bytes recommended)
+        font_name: Font family name (loaded from ``<font_name>.ttf``)
+        font_size: Font size in pixels
     
     Returns:
-        tuple: (encryption_key, salt)
+        A PIL font object, or None if no font could be loaded
     """
-    if salt is None:
-        salt = secrets.token_bytes(16)
-    
-    # Create hash from image pixel data
-    image_hash = hashlib.sha256(image_data).digest()
-    
-    # Use PBKDF2 to derive a proper encryption key
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,
-    )
-    key = base64.urlsafe_b64encode(kdf.derive(image_hash))
-    return key, salt
+    try:
+        return ImageFont.truetype(f"{font_name}.ttf", font_size,
+                                  layout_engine=ImageFont.Layout.BASIC)
+    except:
+        return _load_default_font()
 
 
 def add_watermark(img, text, position="bottom-right", opacity=0.8, font_name="Arial", font_size=20):
@@ -81,27 +128,15 @@ def add_watermark(img, text, position="bottom-right", opacity=0.8, font_name="Ar
         PIL Image with watermark applied
     """
     try:
-        # Create a copy to work with
-        watermarked = img.copy()
-        draw = ImageDraw.Draw(watermarked)
-        
-        # Try to load font, fallback to default if not available
-        try:
-            font = ImageFont.truetype(f"{font_name}.ttf", font_size)
-        except:
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = None
+        font = _load_font(font_name, font_size)
         
         # Get text dimensions
         if font:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            bbox = font.getbbox(text)
         else:
-            text_width = len(text) * 8
-            text_height = 16
+            bbox = (0, 0, len(text) * 8, 16)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
         
         # Calculate position
         width, height = img.size
@@ -117,29 +152,149 @@ def add_watermark(img, text, position="bottom-right", opacity=0.8, font_name="Ar
         
         pos = positions.get(position, positions['bottom-right'])
         
-        # Draw text shadows for visibility
-        for offset_x, offset_y in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
-            if font:
-                draw.text((pos[0] + offset_x, pos[1] + offset_y), text, font=font, fill=(0, 0, 0))
-            else:
-                draw.text((pos[0] + offset_x, pos[1] + offset_y), text, fill=(0, 0, 0))
+        # Render the watermark once into a transparent tile, leaving room
+        # around the glyphs for the dilated, blurred shadow
+        margin = 4
+        tile = Image.new('RGBA', (text_width + 2 * margin, text_height + 2 * margin), (0, 0, 0, 0))
+        origin = (margin - bbox[0], margin - bbox[1])
+        
+        # Draw the text shadow once, thicken it into an outline, then soften
+        # it and restore the edge density the blur spreads out
+        ImageDraw.Draw(tile).text(origin, text, font=font, fill=(0, 0, 0, 255))
+        tile = tile.filter(ImageFilter.MaxFilter(3)).filter(ImageFilter.GaussianBlur(radius=1))
+        tile.putalpha(tile.getchannel('A').point(lambda a: min(255, a * 2)))
         
         # Draw main text
-        if font:
-            draw.text(pos, text, font=font, fill=(255, 255, 255))
-        else:
-            draw.text(pos, text, fill=(255, 255, 255))
+        ImageDraw.Draw(tile).text(origin, text, font=font, fill=(255, 255, 255, 255))
         
-        return watermarked
+        # Apply opacity to the whole tile
+        opacity = min(max(opacity, 0.0), 1.0)
+        if opacity < 1.0:
+            tile.putalpha(tile.getchannel('A').point(lambda a: round(a * opacity)))
+        
+        # Composite the tile at the text position, clipping anything that
+        # falls off the top or left edge
+        dest_x = pos[0] + bbox[0] - margin
+        dest_y = pos[1] + bbox[1] - margin
+        source = (max(0, -dest_x), max(0, -dest_y))
+        if source[0] >= tile.width or source[1] >= tile.height:
+            return img.copy()
+        
+        watermarked = img.convert('RGBA')
+        watermarked.alpha_composite(tile, dest=(max(0, dest_x), max(0, dest_y)), source=source)
+        return watermarked.convert(img.mode)
     
     except Exception as e:
         print(f"Watermark error: {e}")
         return img
 
 
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _embed_lsb_kernel(flat, payload):
+        for i in range(payload.size):
+            byte = payload[i]
+            base = i * 8
+            for j in range(8):
+                flat[base + j] = (flat[base + j] & 0xFE) | ((byte >> (7 - j)) & 1)
+
+    @njit(cache=True, boundscheck=False)
+    def _extract_lsb_kernel(flat, n_bytes):
+        out = np.empty(n_bytes, dtype=np.uint8)
+        for i in range(n_bytes):
+            b = 0
+            for j in range(8):
+                b = (b << 1) | (flat[i * 8 + j] & 1)
+            out[i] = b
+        return out
+else:
+    _embed_lsb_kernel = None
+    _extract_lsb_kernel = None
+
+
+def _embed_lsb(flat, data):
+    """
+    Write data bits (MSB first) into the least significant bits of pixel bytes.
+    
+    Uses the compiled ``_celfie_fast`` extension or the Numba kernel when
+    available; both read the payload bytes directly. Otherwise eight byte
+    lanes are processed per operation by viewing the pixels and unpacked bits
+    as uint64 (each unpacked bit is 0 or 1, so it already sits in its lane's
+    LSB), and any remainder that does not fill a whole lane is written
+    bytewise.
+    
+    Args:
+        flat: Writable, contiguous uint8 array of channel values (modified in place)
+        data: Bytes to hide, one bit per channel starting at ``flat[0]``
+    """
+    if _celfie_fast is not None:
+        _celfie_fast.embed_bits(flat, data)
+        return
+    
+    payload = np.frombuffer(data, dtype=np.uint8)
+    if _embed_lsb_kernel is not None:
+        if flat.size < payload.size * 8:
+            raise ValueError("Payload does not fit in pixel buffer")
+        _embed_lsb_kernel(flat, payload)
+        return
+    
+    bits = np.unpackbits(payload)
+    n = bits.size
+    n64 = n - n % 8
+    if n64:
+        lanes = flat[:n64].view(np.uint64)
+        lanes &= LSB_CLEAR_MASK_64
+        lanes |= bits[:n64].view(np.uint64)
+    if n64 < n:
+        flat[n64:n] = (flat[n64:n] & 0xFE) | bits[n64:]
+
+
+def _extract_lsb(flat, n_bytes):
+    """
+    Rebuild bytes from the least significant bits of pixel bytes.
+    
+    Args:
+        flat: uint8 array of channel values, starting at the first bit to read
+        n_bytes: Number of bytes to reassemble (reads ``n_bytes * 8`` channels)
+    
+    Returns:
+        bytes: The reassembled data, most significant bit first
+    """
+    if _celfie_fast is not None:
+        return _celfie_fast.extract_bits(flat, n_bytes)
+    if _extract_lsb_kernel is not None:
+        if flat.size < n_bytes * 8:
+            raise ValueError("Not enough pixel data to extract")
+        return _extract_lsb_kernel(flat, n_bytes).tobytes()
+    return np.packbits(flat[:n_bytes * 8] & 1).tobytes()
+
+
+def _read_channels(img, n_channels):
+    """
+    Read the first channel values of an image as RGB bytes.
+    
+    Only the top rows needed to cover ``n_channels`` values are cropped and
+    converted, so small payloads in large images do not touch the rest.
+    
+    Args:
+        img: PIL Image object
+        n_channels: Number of R/G/B values needed, in row-major order
+    
+    Returns:
+        numpy.ndarray: Flat uint8 array holding at least ``n_channels`` values
+    """
+    width, height = img.size
+    rows = min(height, -(-n_channels // (CHANNELS * width)))
+    region = img.crop((0, 0, width, rows))
+    if region.mode != 'RGB':
+        region = region.convert('RGB')
+    return np.frombuffer(region.tobytes(), dtype=np.uint8)
+
+
 def encode(input_path, output_path, message, link="", watermark_text=None,
            watermark_position="bottom-left", watermark_opacity=0.8, 
-           watermark_font="Arial", watermark_size=20):
+           watermark_font="Arial", watermark_size=20, compress_level=1,
+           compression="zlib"):
     """
     Hide a message and optional link in an image using LSB steganography with encryption.
     
@@ -154,6 +309,10 @@ def encode(input_path, output_path, message, link="", watermark_text=None,
         watermark_opacity (float): Opacity of watermark (0.0-1.0)
         watermark_font (str): Font family for watermark
         watermark_size (int): Font size for watermark
+        compress_level (int): PNG deflate level (0-9). PNG is lossless at
+            every level; 1 is the fastest setting that still compresses
+        compression (str): Codec for the hidden payload, "zlib" or "zstd".
+            "zstd" is faster but requires pyzstd, also when decoding
     
     Returns:
         bool: True if successful, raises exception on failure
@@ -171,14 +330,25 @@ def encode(input_path, output_path, message, link="", watermark_text=None,
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input image not found: {input_path}")
     
-    # Open the image and convert to RGB
-    img = Image.open(input_path)
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
+    if compression not in ("zlib", "zstd"):
+        raise ValueError(f"Unknown compression: {compression!r} (use 'zlib' or 'zstd')")
+    if compression == "zstd" and pyzstd is None:
+        raise ImportError("compression='zstd' requires the pyzstd package")
     
+    # Open the image (header only) and check it can hold any payload at all
+    img = Image.open(input_path)
     width, height = img.size
     print(f"Image dimensions: {width}x{height}")
     
+    max_bytes = (width * height * CHANNELS) // 8 - HEADER_SIZE
+    if max_bytes < GCM_TAG_SIZE:
+        raise ValueError(f"Image too small to hide data. Need at least {HEADER_SIZE + GCM_TAG_SIZE} bytes of capacity, "
+                         f"have {max_bytes + HEADER_SIZE} bytes")
+    
+    # Convert to RGB; everything below assumes CHANNELS == 3
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    
     # Apply watermark if specified
     if watermark_text:
         print(f"Applying watermark: '{watermark_text}'")
@@ -197,63 +367,61 @@ def encode(input_path, output_path, message, link="", watermark_text=None,
     
     # Prepare data for encoding
     message_bytes = full_message.encode('utf-8')
-    compressed_data = zlib.compress(message_bytes, level=9)
-    
-    # Generate random encryption key
-    random_key = secrets.token_bytes(32)
-    encryption_key = base64.urlsafe_b64encode(random_key)
-    salt = secrets.token_bytes(16)
-    
-    # Encrypt the compressed data
-    fernet = Fernet(encryption_key)
-    encrypted_data = fernet.encrypt(compressed_data)
+    if compression == "zstd":
+        version = ZSTD_VERSION
+        # Worker threads only pay off for payloads larger than a zstd job,
+        # and need a libzstd built with multithreading support
+        zstd_workers = 0
+        if pyzstd.zstd_support_multithread and len(message_bytes) > ZSTD_MT_MIN_SIZE:
+            zstd_workers = _zstd_threads
+        compressed_data = pyzstd.compress(message_bytes, level_or_option={
+            pyzstd.CParameter.compressionLevel: 3,
+            pyzstd.CParameter.nbWorkers: zstd_workers,
+        })
+    else:
+        version = ZLIB_VERSION
+        compressed_data = zlib.compress(message_bytes, level=9)
+    
+    # Generate random encryption key and nonce from a single urandom call
+    random_bytes = os.urandom(32 + 12)
+    random_key = random_bytes[:32]
+    nonce = random_bytes[32:]
+    
+    # Encrypt and authenticate the compressed data
+    encrypted_data = AESGCM(random_key).encrypt(nonce, compressed_data, None)
     
     print(f"Data encrypted: {len(compressed_data)} -> {len(encrypted_data)} bytes")
     
+    # Check image capacity
+    if len(encrypted_data) > max_bytes:
+        raise ValueError(f"Message too large for this image. Need {HEADER_SIZE + len(encrypted_data)} bytes, "
+                         f"have {max_bytes + HEADER_SIZE} bytes")
+    
     # Create header structure
     signature_bytes = SIGNATURE.encode('utf-8')
-    header = struct.pack(
-        "<6sI32s16sQ8s",
+    header = HEADER_STRUCT.pack(
         signature_bytes,      # "CELFIE" signature
-        VERSION,              # Version number
+        version,              # Version number (selects cipher and codec)
         random_key,           # Encryption key
-        salt,                 # Salt for security
+        nonce,                # AES-GCM nonce (+4 reserved bytes)
         len(encrypted_data),  # Data length
         DELIMITER             # Delimiter pattern
     )
     
     # Combine header and encrypted data
     data_to_hide = header + encrypted_data
-    binary_data = ''.join(format(b, '08b') for b in data_to_hide)
     
-    # Check image capacity
-    capacity = width * height * 3
-    if len(binary_data) > capacity:
-        raise ValueError(f"Message too large for this image. Need {len(binary_data)} bits, have {capacity} bits")
-    
-    # Get pixel data
-    pixels = list(img.getdata())
-    flat_img = []
-    for pixel in pixels:
-        flat_img.extend(pixel)
+    # Get raw pixel bytes (RGBRGB...) as a writable flat array
+    flat = np.frombuffer(img.tobytes(), dtype=np.uint8).copy()
     
     # Encode data into image LSBs
-    for i, bit in enumerate(binary_data):
-        if i < len(flat_img):
-            flat_img[i] = (flat_img[i] & 0xFE) | int(bit)
+    _embed_lsb(flat, data_to_hide)
     
     # Reconstruct image
-    channels = len(img.getbands())
-    new_pixels = []
-    for i in range(0, len(flat_img), channels):
-        pixel = tuple(flat_img[i:i+channels])
-        new_pixels.append(pixel)
-    
-    encoded_img = Image.new(img.mode, (width, height))
-    encoded_img.putdata(new_pixels)
+    encoded_img = Image.frombytes('RGB', (width, height), flat.tobytes())
     
     # Save as PNG
-    encoded_img.save(output_path, format='PNG', optimize=False, compress_level=0)
+    encoded_img.save(output_path, format='PNG', optimize=False, compress_level=compress_level)
     
     # Verify output
     if not os.path.exists(output_path):
@@ -285,67 +453,66 @@ def decode(image_path):
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image not found: {image_path}")
     
-    # Open the image
-    img = Image.open(image_path)
+    # Open and load the image, releasing the file handle right away
+    with Image.open(image_path) as img:
+        img.load()
     print(f"Image mode: {img.mode}, Size: {img.size}")
     
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
-    
-    # Get pixel data
-    pixels = list(img.getdata())
-    flat_img = []
-    for pixel in pixels:
-        flat_img.extend(pixel)
+    width, height = img.size
+    capacity = width * height * CHANNELS
+    if capacity < HEADER_SIZE * 8:
+        print("Image too small to contain Celfie data")
+        return None
     
-    # Extract header bits
-    header_bits = ''.join(str(flat_img[i] & 1) for i in range(HEADER_SIZE * 8))
-    header_bytes = bytearray()
-    for i in range(0, len(header_bits), 8):
-        if i + 8 <= len(header_bits):
-            byte = header_bits[i:i+8]
-            header_bytes.append(int(byte, 2))
+    # Extract header bytes from the top rows only
+    header_bytes = _extract_lsb(_read_channels(img, HEADER_SIZE * 8), HEADER_SIZE)
     
     # Verify signature
     try:
-        signature = header_bytes[:6].decode('utf-8')
-        if signature != SIGNATURE:
-            print(f"Invalid signature: '{signature}'")
+        signature, version, encryption_key, nonce, data_length, delimiter = HEADER_STRUCT.unpack(header_bytes)
+        if signature != SIGNATURE.encode('utf-8'):
+            print(f"Invalid signature: '{signature.decode('utf-8', errors='replace')}'")
             return None
         
         print(f"Found Celfie signature!")
         
-        # Extract header components
-        version = struct.unpack("<I", bytes(header_bytes[6:10]))[0]
-        encryption_key = bytes(header_bytes[10:42])
-        salt = bytes(header_bytes[42:58])
-        data_length = struct.unpack("<Q", bytes(header_bytes[58:66]))[0]
+        if delimiter != DELIMITER:
+            print("Invalid header delimiter")
+            return None
         
         print(f"Version: {version}, Data length: {data_length}")
         
+        if version < FERNET_VERSION or version > VERSION:
+            print(f"Unsupported version: {version}")
+            return None
+        if version == ZSTD_VERSION and pyzstd is None:
+            print("This image uses zstd compression; install pyzstd to decode it")
+            return None
+        
         # Validate data length
-        max_data = len(flat_img) - HEADER_SIZE * 8
+        max_data = (capacity - HEADER_SIZE * 8) // 8
         if data_length > max_data or data_length > 10_000_000:
             print(f"Invalid data length: {data_length}")
             return None
         
-        # Extract encrypted data
+        # Extract encrypted data, reading only the rows that hold it
         data_start = HEADER_SIZE * 8
-        data_bits = ''.join(str(flat_img[i] & 1) for i in range(data_start, data_start + data_length * 8))
-        
-        encrypted_data = bytearray()
-        for i in range(0, len(data_bits), 8):
-            if i + 8 <= len(data_bits):
-                byte = data_bits[i:i+8]
-                encrypted_data.append(int(byte, 2))
+        flat = _read_channels(img, data_start + data_length * 8)
+        encrypted_data = _extract_lsb(flat[data_start:], data_length)
         
-        # Decrypt
-        fernet_key = base64.urlsafe_b64encode(encryption_key)
-        fernet = Fernet(fernet_key)
-        compressed_data = fernet.decrypt(bytes(encrypted_data))
+        # Decrypt (version 1 images were written with Fernet)
+        if version == FERNET_VERSION:
+            fernet_key = base64.urlsafe_b64encode(encryption_key)
+            fernet = Fernet(fernet_key)
+            compressed_data = fernet.decrypt(encrypted_data)
+        else:
+            compressed_data = AESGCM(encryption_key).decrypt(nonce, encrypted_data, None)
         
         # Decompress
-        message = zlib.decompress(compressed_data).decode('utf-8')
+        if version == ZSTD_VERSION:
+            message = pyzstd.decompress(compressed_data).decode('utf-8')
+        else:
+            message = zlib.decompress(compressed_data).decode('utf-8')
         
         print(f"Successfully decoded message!")
         return message
@@ -375,6 +542,66 @@ def verify_image(image_path):
         return False
 
 
+# Batch workers are spawned rather than forked: forking after a thread pool
+# has started (Numba, zstd, OpenSSL) can deadlock or crash the children
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _init_batch_worker():
+    """Disable zstd worker threads inside encode_many worker processes."""
+    global _zstd_threads
+    _zstd_threads = 0
+
+
+def encode_many(jobs, workers=None, **options):
+    """
+    Encode several images in parallel, one image per worker process.
+    
+    Workers are started with the "spawn" method, so scripts that call this
+    must guard their entry point with ``if __name__ == "__main__":``.
+    
+    Args:
+        jobs: Iterable of (input_path, output_path, message) tuples
+        workers (int, optional): Number of worker processes
+            (defaults to the number of CPUs)
+        **options: Extra keyword arguments passed to every encode() call
+            (link, watermark_text, compress_level, ...)
+    
+    Returns:
+        list: encode() results in the same order as ``jobs``;
+            the first failure is re-raised
+    
+    Example:
+        >>> encode_many([("a.jpg", "a.png", "Copyright 2025"),
+        ...              ("b.jpg", "b.png", "Copyright 2025")],
+        ...             watermark_text="My Studio")
+        [True, True]
+    """
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT,
+                             initializer=_init_batch_worker) as executor:
+        futures = [executor.submit(encode, *job, **options) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def decode_many(image_paths, workers=None):
+    """
+    Decode several images in parallel, one image per worker process.
+    
+    Workers are started with the "spawn" method, so scripts that call this
+    must guard their entry point with ``if __name__ == "__main__":``.
+    
+    Args:
+        image_paths: Iterable of paths to Celfie-encoded images
+        workers (int, optional): Number of worker processes
+            (defaults to the number of CPUs)
+    
+    Returns:
+        list: decode() results (message or None) in the same order as ``image_paths``
+    """
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT) as executor:
+        return list(executor.map(decode, image_paths))
+
+
 # Example usage
 if __name__ == "__main__":
     print("Celfie Lock - Image Protection with Steganography")